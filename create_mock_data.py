@@ -1,23 +1,62 @@
 #!/usr/bin/env python3
 
+import io
+import tempfile
 import zipfile
 import os
-from borsh_construct import I128
+
+# Output directories already created by this process
+_made_dirs = set()
+
+# Serialize an integer as a borsh I128 (16 bytes, little-endian, signed)
+def _serialize_i128(value: int) -> bytes:
+    if not isinstance(value, int):
+        raise TypeError(f"I128 value must be an int, got {type(value).__name__}")
+    return value.to_bytes(16, 'little', signed=True)
 
 # Create a mock protected data ZIP file with integer A
 def create_mock_protected_data(value_a=5, output_path="mock/protectedData/scoring_mock"):
     """
     Create a mock protected data file with integer A for testing
+
+    The entry is stored uncompressed; DEFLATE cannot shrink a 16 byte I128.
     """
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    output_dir = os.path.dirname(output_path)
+    if output_dir and output_dir not in _made_dirs:
+        os.makedirs(output_dir, exist_ok=True)
+        _made_dirs.add(output_dir)
     
     # Serialize integer A using borsh
-    serialized_a = I128.build(value_a)
+    serialized_a = _serialize_i128(value_a)
     
-    # Create ZIP file with integer A
-    with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+    # Create ZIP file with integer A in memory
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_STORED) as zipf:
         zipf.writestr('A', serialized_a)
     
+    # Write it out in one go and swap it into place atomically
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=output_dir or '.')
+    except FileNotFoundError:
+        # the directory was removed after _made_dirs recorded it
+        if not output_dir:
+            raise
+        os.makedirs(output_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=output_dir)
+    try:
+        try:
+            # mkstemp creates the file 0600, keep the usual 0644
+            os.fchmod(fd, 0o644)
+            view = memoryview(buf.getvalue())
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    
     print(f"Created mock protected data at: {output_path}")
     print(f"Contains integer A = {value_a}")
     print(f"Serialized size: {len(serialized_a)} bytes")
@@ -4,6 +4,58 @@ import sys
 import protected_data
 
 IEXEC_OUT = os.getenv('IEXEC_OUT')
+# result.json by default, binary result for TEE consumers that opt in
+RESULT_FORMAT = os.getenv('IEXEC_RESULT_FORMAT', 'json')
+RESULT_FILENAMES = {
+    'json': 'result.json',
+    'msgpack': 'result.msgpack',
+    'cbor': 'result.cbor',
+}
+if RESULT_FORMAT not in RESULT_FILENAMES:
+    print(f"Unknown IEXEC_RESULT_FORMAT {RESULT_FORMAT!r}, writing JSON result")
+    RESULT_FORMAT = 'json'
+RESULT_FILENAME = RESULT_FILENAMES[RESULT_FORMAT]
+RESULT_PATH = os.path.join(IEXEC_OUT, RESULT_FILENAME)
+COMPUTED_FILENAME = 'computed.json'
+# output files are opened relative to this fd so IEXEC_OUT is resolved once
+OUT_DIR_FD = os.open(IEXEC_OUT, os.O_RDONLY | os.O_DIRECTORY)
+
+# Attempt to get the encrypted integer A from protected data once at startup
+PROTECTED_A = None
+PROTECTED_A_ERROR = None
+if protected_data.hasDataset():
+    try:
+        PROTECTED_A = protected_data.getValue('A', 'i128')
+    except Exception as e:
+        PROTECTED_A_ERROR = e
+else:
+    PROTECTED_A_ERROR = Exception('Missing protected data')
+
+
+def encode_result(data):
+    if RESULT_FORMAT == 'msgpack':
+        import msgpack
+        try:
+            return msgpack.packb(data)
+        except OverflowError:
+            # msgpack integers are limited to 64 bits, A is an i128
+            raise Exception("Result integer exceeds msgpack 64-bit range, use IEXEC_RESULT_FORMAT=cbor")
+    if RESULT_FORMAT == 'cbor':
+        import cbor2
+        return cbor2.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+def write_output(filename, data):
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644,
+                 dir_fd=OUT_DIR_FD)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 
 computed_json = {}
 
@@ -12,13 +64,12 @@ try:
     
     # Decrypt integer A from protected data using MEDPRIVATE key
     used_protected_data = False
-    try:
-        # Attempt to get the encrypted integer A from protected data
-        protected_integer_A = protected_data.getValue('A', 'i128')
+    if PROTECTED_A_ERROR is None:
+        protected_integer_A = PROTECTED_A
         used_protected_data = True
         print(f"Successfully decrypted integer A from protected data")
-    except Exception as e:
-        print('Error decrypting protected data A:', e)
+    else:
+        print('Error decrypting protected data A:', PROTECTED_A_ERROR)
         # Fallback: use command line argument if protected data fails
         args = sys.argv[1:]
         if len(args) > 0:
@@ -35,42 +86,35 @@ try:
     print(f"Applied scoring logic (A * 2) = {result}")
     
     # Create result data structure - hide input if from protected data
+    result_data = {
+        "scoring_logic": "A * 2",
+        "result": result,
+        "status": "success",
+        "data_source": "protected_data" if used_protected_data else "command_line_args"
+    }
     if used_protected_data:
-        result_data = {
-            "scoring_logic": "A * 2",
-            "result": result,
-            "status": "success",
-            "data_source": "protected_data"
-        }
         print("Input from protected data - not included in output for security")
     else:
-        result_data = {
-            "input_A": protected_integer_A,
-            "scoring_logic": "A * 2",
-            "result": result,
-            "status": "success",
-            "data_source": "command_line_args"
-        }
+        result_data["input_A"] = protected_integer_A
     
     # unencrypted result to output file
-    with open(IEXEC_OUT + '/result.json', 'w') as f:
-        json.dump(result_data, f, indent=2)
+    write_output(RESULT_FILENAME, encode_result(result_data))
     
     print(f"Result written to output: {result}")
-    computed_json = {'deterministic-output-path': IEXEC_OUT + '/result.json'}
+    computed_json = {'deterministic-output-path': RESULT_PATH}
     
 except Exception as e:
-    print(f"Error in scoring logic: {e}")
+    error_message = str(e)
+    print(f"Error in scoring logic: {error_message}")
     error_data = {
         "status": "error",
-        "error_message": str(e)
+        "error_message": error_message
     }
     
-    with open(IEXEC_OUT + '/result.json', 'w') as f:
-        json.dump(error_data, f, indent=2)
+    write_output(RESULT_FILENAME, encode_result(error_data))
     
-    computed_json = {'deterministic-output-path': IEXEC_OUT + '/result.json',
-                     'error-message': str(e)}
+    computed_json = {'deterministic-output-path': RESULT_PATH,
+                     'error-message': error_message}
 finally:
-    with open(IEXEC_OUT + '/computed.json', 'w') as f:
-        json.dump(computed_json, f)
+    write_output(COMPUTED_FILENAME, json.dumps(computed_json, separators=(',', ':')).encode())
+    os.close(OUT_DIR_FD)
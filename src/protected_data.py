@@ -1,18 +1,28 @@
 # dataprotector deserializer module
 import os
 import zipfile
-from borsh_construct import String, I128, F64, Bool
 
 
-def getValue(path: str, schema: str):
-    file_path = path.replace('.', '/')
+def _dataset_file_path():
     IEXEC_IN = os.getenv('IEXEC_IN')
     IEXEC_DATASET_FILENAME = os.getenv('IEXEC_DATASET_FILENAME')
 
-    if IEXEC_DATASET_FILENAME == None:
-        raise Exception('Missing protected data')
+    if IEXEC_IN == None or IEXEC_DATASET_FILENAME == None:
+        return None
+
+    return os.path.join(IEXEC_IN, IEXEC_DATASET_FILENAME)
+
+
+def hasDataset():
+    return _dataset_file_path() != None
 
-    dataset_file_path = os.path.join(IEXEC_IN, IEXEC_DATASET_FILENAME)
+
+def getValue(path: str, schema: str):
+    file_path = path.replace('.', '/')
+    dataset_file_path = _dataset_file_path()
+
+    if dataset_file_path == None:
+        raise Exception('Missing protected data')
 
     file_bytes: bytes
     try:
@@ -24,6 +34,9 @@ def getValue(path: str, schema: str):
     except:
         raise Exception(f"Failed to load path {path}")
 
+    # deferred so runs without protected data never load borsh_construct
+    from borsh_construct import String, I128, F64, Bool
+
     try:
         if schema == 'bool':
             return Bool.parse(file_bytes)